@@ -1,5 +1,3 @@
-from functools import cached_property
-
 import cogs5e.models.sheet.player as player_api
 from aliasing import helpers
 from aliasing.utils import optional_cast_arg_or_default, UNSET
@@ -8,6 +6,30 @@ from cogs5e.models.errors import ConsumableException
 from cogs5e.models.sheet.coinpurse import CoinsArgs
 from utils.constants import COIN_TYPES
 
+_COIN_KEYS = frozenset(COIN_TYPES)
+
+
+class cached_property:
+    """
+    A lockless stand-in for :func:`functools.cached_property`.
+
+    The stdlib implementation takes a per-instance lock on first access, which is pure overhead in the
+    single-threaded alias interpreter; this one just computes the value and shadows itself in the
+    instance dict.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.attrname = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.attrname] = value
+        return value
+
 
 class AliasCharacter(AliasStatBlock):
     def __init__(self, character, interpreter=None):
@@ -20,6 +42,9 @@ class AliasCharacter(AliasStatBlock):
         self._interpreter = interpreter
         self._consumables = None
         self._coinpurse = None
+        self._cc_wrappers = {}
+        self._cvars_cache = None
+        self._csettings_cache = None
 
     # helpers
     def _get_consumable(self, name):
@@ -29,6 +54,13 @@ class AliasCharacter(AliasStatBlock):
             raise ConsumableException(f"There is no counter named {name}.")
         return consumable
 
+    def _wrap_consumable(self, consumable):
+        """Gets the cached AliasCustomCounter wrapping *consumable*, creating it if necessary."""
+        wrapper = self._cc_wrappers.get(id(consumable))
+        if wrapper is None:
+            wrapper = self._cc_wrappers[id(consumable)] = AliasCustomCounter(consumable)
+        return wrapper
+
     # methods
     # --- ccs ---
     @property
@@ -39,7 +71,7 @@ class AliasCharacter(AliasStatBlock):
         :rtype: list[AliasCustomCounter]
         """
         if self._consumables is None:
-            self._consumables = [AliasCustomCounter(cc) for cc in self._character.consumables]
+            self._consumables = [self._wrap_consumable(cc) for cc in self._character.consumables]
         return self._consumables
 
     def cc(self, name):
@@ -51,7 +83,7 @@ class AliasCharacter(AliasStatBlock):
         :rtype: AliasCustomCounter
         :raises: :exc:`ConsumableException` if the counter does not exist.
         """
-        return AliasCustomCounter(self._get_consumable(name))
+        return self._wrap_consumable(self._get_consumable(name))
 
     def get_cc(self, name):
         """
@@ -98,13 +130,15 @@ class AliasCharacter(AliasStatBlock):
         :returns: The cc's new value.
         :rtype: int
         """
-        return self._get_consumable(name).set(int(value), strict)
+        return self._get_consumable(name).set(value if type(value) is int else int(value), strict)
 
     def mod_cc(self, name, val: int, strict=False):
         """
         Modifies the value of a custom counter. Equivalent to ``set_cc(name, get_cc(name) + value, strict)``.
         """
-        return self.set_cc(name, self.get_cc(name) + val, strict)
+        cc = self._get_consumable(name)
+        new_value = cc.value + val
+        return cc.set(new_value if type(new_value) is int else int(new_value), strict)
 
     def delete_cc(self, name):
         """
@@ -113,8 +147,14 @@ class AliasCharacter(AliasStatBlock):
         :param str name: The name of the custom counter to delete.
         :raises: :exc:`ConsumableException` if the counter does not exist.
         """
-        to_delete = self._get_consumable(name)
-        self._character.consumables.remove(to_delete)
+        name = str(name)
+        for i, consumable in enumerate(self._character.consumables):
+            if consumable.name == name:
+                del self._character.consumables[i]
+                self._cc_wrappers.pop(id(consumable), None)
+                self._consumables = None  # reset cache
+                return
+        raise ConsumableException(f"There is no counter named {name}.")
 
     def create_cc_nx(
         self,
@@ -136,24 +176,10 @@ class AliasCharacter(AliasStatBlock):
         >>> if not cc_exists(name):
         >>>     create_cc(name, minVal, maxVal, reset, dispType, reset_to, reset_by, title, desc)
         """
-        if minVal is not None:
-            minVal = str(minVal)
-        if maxVal is not None:
-            maxVal = str(maxVal)
-        if reset is not None:
-            reset = str(reset)
-        if dispType is not None:
-            dispType = str(dispType)
-        if reset_to is not None:
-            reset_to = str(reset_to)
-        if reset_by is not None:
-            reset_by = str(reset_by)
-        if title is not None:
-            title = str(title)
-        if desc is not None:
-            desc = str(desc)
-        if initial_value is not None:
-            initial_value = str(initial_value)
+        minVal, maxVal, reset, dispType, reset_to, reset_by, title, desc, initial_value = (
+            None if v is None else str(v)
+            for v in (minVal, maxVal, reset, dispType, reset_to, reset_by, title, desc, initial_value)
+        )
 
         if not self.cc_exists(name):
             new_consumable = player_api.CustomCounter.new(
@@ -171,7 +197,7 @@ class AliasCharacter(AliasStatBlock):
             )
             self._character.consumables.append(new_consumable)
             self._consumables = None  # reset cache
-            return AliasCustomCounter(new_consumable)
+            return self._wrap_consumable(new_consumable)
 
     def create_cc(self, name: str, *args, **kwargs):
         """
@@ -255,7 +281,7 @@ class AliasCharacter(AliasStatBlock):
         self._character.consumables.insert(self._character.consumables.index(counter), edit_consumable)
         self._character.consumables.remove(counter)
         self._consumables = None  # reset cache
-        return AliasCustomCounter(edit_consumable)
+        return self._wrap_consumable(edit_consumable)
 
     def cc_exists(self, name):
         """
@@ -265,7 +291,7 @@ class AliasCharacter(AliasStatBlock):
         :returns: Whether the counter exists.
         """
         name = str(name)
-        return name in [con.name for con in self._character.consumables]
+        return any(con.name == name for con in self._character.consumables)
 
     def cc_str(self, name):
         """
@@ -293,7 +319,9 @@ class AliasCharacter(AliasStatBlock):
 
         :rtype: dict
         """
-        return self._character.cvars.copy()
+        if self._cvars_cache is None:
+            self._cvars_cache = self._character.cvars.copy()
+        return self._cvars_cache.copy()
 
     def set_cvar(self, name, val: str):
         """
@@ -306,6 +334,7 @@ class AliasCharacter(AliasStatBlock):
         name = str(name)
         val = str(val)
         helpers.set_cvar(self._character, name, val)
+        self._cvars_cache = None  # reset cache
         # noinspection PyProtectedMember
         self._interpreter._names[name] = val
 
@@ -332,6 +361,7 @@ class AliasCharacter(AliasStatBlock):
         name = str(name)
         if name in self._character.cvars:
             del self._character.cvars[name]
+            self._cvars_cache = None  # reset cache
 
     # --- other properties ---
     @cached_property
@@ -404,7 +434,9 @@ class AliasCharacter(AliasStatBlock):
 
         :rtype: dict
         """
-        return self._character.options.dict()
+        if self._csettings_cache is None:
+            self._csettings_cache = self._character.options.dict()
+        return self._csettings_cache.copy()
 
     @property
     def coinpurse(self):
@@ -423,6 +455,8 @@ class AliasCharacter(AliasStatBlock):
 
 
 class AliasCustomCounter:
+    __slots__ = ("_cc",)
+
     def __init__(self, cc):
         """
         :type cc: cogs5e.models.sheet.player.CustomCounter
@@ -529,7 +563,7 @@ class AliasCustomCounter:
         :return: The cc's new value.
         :rtype: int
         """
-        return self._cc.set(int(new_value), strict)
+        return self._cc.set(new_value if type(new_value) is int else int(new_value), strict)
 
     def reset(self):
         """
@@ -579,6 +613,8 @@ class AliasCustomCounter:
 
 
 class AliasDeathSaves:
+    __slots__ = ("_death_saves",)
+
     def __init__(self, death_saves):
         """
         :type death_saves: cogs5e.models.sheet.player.DeathSaves
@@ -741,6 +777,8 @@ class AliasCoinpurse:
     An object holding the coinpurse for the active character.
     """
 
+    __slots__ = ("_coinpurse", "_parent_statblock", "_dict")
+
     def __init__(self, coinpurse, parent_statblock):
         """
         :type coinpurse: cogs5e.models.sheet.coinpurse.Coinpurse
@@ -748,9 +786,10 @@ class AliasCoinpurse:
         """
         self._coinpurse = coinpurse
         self._parent_statblock = parent_statblock
+        self._dict = None
 
     def __getattr__(self, item):
-        if item not in COIN_TYPES:
+        if item not in _COIN_KEYS:
             raise ValueError(f"{item} is not valid coin.")
         return getattr(self._coinpurse, item)
 
@@ -779,7 +818,7 @@ class AliasCoinpurse:
         :return: The string representation of the chosen coin type.
         :rtype: str
         """
-        if cointype not in COIN_TYPES:
+        if cointype not in _COIN_KEYS:
             raise ValueError(f"{cointype} is not valid coin.")
         return self._coinpurse.coin_string(cointype)
 
@@ -806,15 +845,17 @@ class AliasCoinpurse:
         :return: A dict representation of the delta changes for each coin type.
         :rtype: dict
         """
+        coinpurse = self._coinpurse
         coins = CoinsArgs(pp, gp, ep, sp, cp)
         if autoconvert:
-            coins = self._coinpurse.auto_convert_down(coins)
-        self._coinpurse.set_currency(
-            self._coinpurse.pp + coins.pp,
-            self._coinpurse.gp + coins.gp,
-            self._coinpurse.ep + coins.ep,
-            self._coinpurse.sp + coins.sp,
-            self._coinpurse.cp + coins.cp,
+            coins = coinpurse.auto_convert_down(coins)
+        self._dict = None  # reset cache
+        coinpurse.set_currency(
+            coinpurse.pp + coins.pp,
+            coinpurse.gp + coins.gp,
+            coinpurse.ep + coins.ep,
+            coinpurse.sp + coins.sp,
+            coinpurse.cp + coins.cp,
         )
         return {"pp": coins.pp, "gp": coins.gp, "ep": coins.ep, "sp": coins.sp, "cp": coins.cp, "total": coins.total}
 
@@ -828,6 +869,7 @@ class AliasCoinpurse:
         :param int sp: Silver Pieces
         :param int cp: Copper Pieces
         """
+        self._dict = None  # reset cache
         self._coinpurse.set_currency(pp, gp, ep, sp, cp)
 
     def autoconvert(self):
@@ -835,6 +877,7 @@ class AliasCoinpurse:
         Converts all of your coins into the highest value coins possible.
         100cp turns into 1gp, 5sp turns into 1ep, etc.
         """
+        self._dict = None  # reset cache
         self._coinpurse.consolidate_coins()
 
     def get_coins(self) -> dict:
@@ -844,11 +887,28 @@ class AliasCoinpurse:
         :return: A dict of your current coinpurse, e.g. ``{"pp":0, "gp":1, "ep":0, "sp":2, "cp":3, "total": 1.23}``
         :rtype: dict
         """
-        return {
-            "pp": self._coinpurse.pp,
-            "gp": self._coinpurse.gp,
-            "ep": self._coinpurse.ep,
-            "sp": self._coinpurse.sp,
-            "cp": self._coinpurse.cp,
-            "total": self._coinpurse.total,
-        }
+        if self._dict is None:
+            self._dict = {
+                "pp": self._coinpurse.pp,
+                "gp": self._coinpurse.gp,
+                "ep": self._coinpurse.ep,
+                "sp": self._coinpurse.sp,
+                "cp": self._coinpurse.cp,
+                "total": self._coinpurse.total,
+            }
+        return self._dict.copy()
+
+
+# define real descriptors for the five coin attributes so hot accesses like ``coinpurse.gp`` go through
+# the C-level property protocol instead of falling through to the __getattr__ miss path every read;
+# __getattr__ stays as the catch-all that raises for invalid coin names
+for _coin in COIN_TYPES:
+    setattr(
+        AliasCoinpurse,
+        _coin,
+        property(
+            lambda self, _coin=_coin: getattr(self._coinpurse, _coin),
+            doc=f"The number of {_coin} this character has.",
+        ),
+    )
+del _coin
@@ -1,4 +1,5 @@
 import base64
+import functools
 import hashlib
 import hmac
 import random
@@ -259,6 +260,13 @@ def verify_signature(ctx: disnake.ext.commands.Context, data: str):
     }
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_coins_cached(args: str) -> tuple:
+    """Parses a coin string into an immutable (pp, gp, ep, sp, cp, total) tuple, cached per input string."""
+    coin_args = parse_coin_args(args)
+    return coin_args.pp, coin_args.gp, coin_args.ep, coin_args.sp, coin_args.cp, coin_args.total
+
+
 def parse_coins(args: str) -> dict:
     """
     Parses a coin string into a representation of each currency.
@@ -268,12 +276,5 @@ def parse_coins(args: str) -> dict:
     :return: A dict of the coin changes, e.g. ``{"pp":0, "gp":1, "ep":0, "sp":-2, "cp":3, "total": 0.83}``
     :rtype: dict
     """
-    coin_args = parse_coin_args(args)
-    return {
-        "pp": coin_args.pp,
-        "gp": coin_args.gp,
-        "ep": coin_args.ep,
-        "sp": coin_args.sp,
-        "cp": coin_args.cp,
-        "total": coin_args.total,
-    }
+    pp, gp, ep, sp, cp, total = _parse_coins_cached(str(args))
+    return {"pp": pp, "gp": gp, "ep": ep, "sp": sp, "cp": cp, "total": total}
@@ -271,7 +271,12 @@ class CustomCounter:
             elif new_value > maxv:
                 raise CounterOutOfBounds(f"{self.name} cannot be set to {new_value} (max {maxv}).")
 
-        new_value = int(min(max(minv, new_value), maxv))
+        if type(new_value) is not int:
+            new_value = int(new_value)
+        if new_value < minv:
+            new_value = minv
+        if new_value > maxv:
+            new_value = maxv
         old_value = self._value
         self._value = new_value
 
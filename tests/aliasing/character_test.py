@@ -0,0 +1,46 @@
+import json
+import os
+
+from aliasing.api.character import AliasCharacter
+from cogs5e.models.character import Character
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+
+
+def _load_character():
+    with open(os.path.join(dir_path, "..", "static", "char-ara.json")) as f:
+        return Character.from_dict(json.load(f))
+
+
+# TODO: AliasCustomCounter tests
+# TODO: AliasDeathSaves tests
+# TODO: AliasAction tests
+def test_cvars_mutation_does_not_leak():
+    character = _load_character()
+    alias_char = AliasCharacter(character)
+
+    cvars = alias_char.cvars
+    cvars["some_test_cvar"] = "1"
+    assert "some_test_cvar" not in alias_char.cvars
+    assert "some_test_cvar" not in character.cvars
+
+    alias_char.cvars.clear()
+    assert alias_char.cvars == character.cvars
+
+
+def test_csettings_mutation_does_not_leak():
+    character = _load_character()
+    alias_char = AliasCharacter(character)
+
+    settings = alias_char.csettings
+    settings.clear()
+    assert alias_char.csettings == character.options.dict()
+
+
+def test_get_coins_mutation_does_not_leak():
+    character = _load_character()
+    alias_char = AliasCharacter(character)
+
+    coins = alias_char.coinpurse.get_coins()
+    coins["pp"] = coins["pp"] + 9999
+    assert alias_char.coinpurse.get_coins()["pp"] == character.coinpurse.pp
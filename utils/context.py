@@ -4,26 +4,31 @@ import time
 import discord
 from discord.ext.commands import Context
 
-from cogs5e.exploration import Explore
-from cogs5e.exploration.encounter import Encounter
-from cogs5e.initiative import Combat
-from cogs5e.models.character import Character
-from utils.settings import ServerSettings
-
-_sentinel = object()
-
 log = logging.getLogger(__name__)
 
+# fetchers lazily bound on first use by the accessors below, so the module attribute resolution
+# (e.g. Character.from_ctx) happens once per process rather than once per command
+_character_from_ctx = None
+_combat_from_ctx = None
+_explore_from_ctx = None
+_encounter_from_ctx = None
+_server_settings_for_guild = None
+
 
 class AvraeContext(Context):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        self._character = _sentinel
-        self._combat = _sentinel
-        self._exploration = _sentinel
-        self._encounter = _sentinel
-        self._server_settings = _sentinel
+        self._character = None
+        self._character_cached = False
+        self._combat = None
+        self._combat_cached = False
+        self._exploration = None
+        self._exploration_cached = False
+        self._encounter = None
+        self._encounter_cached = False
+        self._server_settings = None
+        self._server_settings_cached = False
         self._last_typing_start = 0
         # NLP metadata
         self.nlp_is_alias = False  # set in aliasing.helpers
@@ -31,6 +36,20 @@ class AvraeContext(Context):
         self.nlp_caster = None  # set in targetutils to provide caster or character info to NLP
         self.nlp_targets = None
 
+    async def _cached_fetch(self, attr, fetcher):
+        """
+        Returns the value cached under *attr*, awaiting ``fetcher(self)`` and caching the result on a miss.
+
+        Only usable by accessors with plain cache semantics; get_character/get_encounter (ignore_guild)
+        and get_server_settings (guildless shortcut) stay specialized.
+        """
+        if getattr(self, f"{attr}_cached"):
+            return getattr(self, attr)
+        value = await fetcher(self)
+        setattr(self, attr, value)
+        setattr(self, f"{attr}_cached", True)
+        return value
+
     async def get_character(self, ignore_guild: bool = False):
         """
         Gets the character active in this context.
@@ -39,11 +58,18 @@ class AvraeContext(Context):
         :raises NoCharacter: If the context has no character (author has none active).
         :rtype: Character
         """
-        if not ignore_guild and self._character is not _sentinel:
+        global _character_from_ctx
+
+        if not ignore_guild and self._character_cached:
             return self._character
-        character = await Character.from_ctx(self, ignore_guild=ignore_guild)
+        if _character_from_ctx is None:
+            from cogs5e.models.character import Character
+
+            _character_from_ctx = Character.from_ctx
+        character = await _character_from_ctx(self, ignore_guild=ignore_guild)
         if not ignore_guild:
             self._character = character
+            self._character_cached = True
         self.nlp_character = character
         return character
 
@@ -54,11 +80,13 @@ class AvraeContext(Context):
         :raises CombatNotFound: If the context has no combat (author has none active).
         :rtype: Combat
         """
-        if self._combat is not _sentinel:
-            return self._combat
-        combat = await Combat.from_ctx(self)
-        self._combat = combat
-        return combat
+        global _combat_from_ctx
+
+        if _combat_from_ctx is None:
+            from cogs5e.initiative import Combat
+
+            _combat_from_ctx = Combat.from_ctx
+        return await self._cached_fetch("_combat", _combat_from_ctx)
 
     async def get_exploration(self):
         """
@@ -67,11 +95,13 @@ class AvraeContext(Context):
         :raises ExplorationNotFound: If the context has no combat (author has none active).
         :rtype: Explore
         """
-        if self._exploration is not _sentinel:
-            return self._exploration
-        explore = await Explore.from_ctx(self)
-        self._exploration = explore
-        return explore
+        global _explore_from_ctx
+
+        if _explore_from_ctx is None:
+            from cogs5e.exploration import Explore
+
+            _explore_from_ctx = Explore.from_ctx
+        return await self._cached_fetch("_exploration", _explore_from_ctx)
 
     async def get_encounter(self, ignore_guild: bool = False):
         """
@@ -81,11 +111,18 @@ class AvraeContext(Context):
         :raises NoEncounter: If the context has no encounter sheet (author has none active).
         :rtype: Encounter
         """
-        if not ignore_guild and self._encounter is not _sentinel:
+        global _encounter_from_ctx
+
+        if not ignore_guild and self._encounter_cached:
             return self._encounter
-        encounter = await Encounter.from_ctx(self, ignore_guild=ignore_guild)
+        if _encounter_from_ctx is None:
+            from cogs5e.exploration.encounter import Encounter
+
+            _encounter_from_ctx = Encounter.from_ctx
+        encounter = await _encounter_from_ctx(self, ignore_guild=ignore_guild)
         if not ignore_guild:
             self._encounter = encounter
+            self._encounter_cached = True
         return encounter
 
     async def get_server_settings(self):
@@ -94,20 +131,28 @@ class AvraeContext(Context):
 
         :rtype: utils.settings.ServerSettings or None
         """
-        if self._server_settings is not _sentinel:
+        global _server_settings_for_guild
+
+        if self._server_settings_cached:
             return self._server_settings
         if self.guild is None:
-            self._server_settings = None
+            self._server_settings_cached = True
             return None
-        server_settings = await ServerSettings.for_guild(self.bot.mdb, self.guild.id)
+        if _server_settings_for_guild is None:
+            from utils.settings import ServerSettings
+
+            _server_settings_for_guild = ServerSettings.for_guild
+        server_settings = await _server_settings_for_guild(self.bot.mdb, self.guild.id)
         self._server_settings = server_settings
+        self._server_settings_cached = True
         return server_settings
 
     # ==== overrides ====
     async def trigger_typing(self):
         # only trigger once every 10 seconds to prevent API spam if multiple methods want to type
-        now = time.time()
-        if now - self._last_typing_start < 10:
+        # monotonic so a wall-clock step (e.g. NTP) can't re-open the throttle window
+        now = time.monotonic_ns()
+        if now - self._last_typing_start < 10_000_000_000:
             return
         self._last_typing_start = now
         try: